@@ -12,23 +12,61 @@
 # -----------------------------
 # 1) استيراد المكتبات الضرورية
 # -----------------------------
+import asyncio
 import os
 import re
 import csv
 import hashlib
+import shelve
 import sqlite3
+import threading
 import time
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+import zlib
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
+from urllib.parse import urlparse
 
-import feedparser                 # لقراءة خلاصات RSS
 import requests                   # لجلب صفحات الويب
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup     # لتحليل HTML واستخراج النصوص
-import pandas as pd               # لتصدير النتائج إلى CSV/Excel
+try:
+    from selectolax.parser import HTMLParser  # محلل HTML مكتوب بلغة C (أسرع بكثير من html.parser)
+except ImportError:
+    HTMLParser = None
+try:
+    import lxml  # noqa: F401  – إن وُجد نستخدمه كمحلل لـ BeautifulSoup بدلاً من html.parser البطيء
+    _BS_PARSER = "lxml"
+except ImportError:
+    _BS_PARSER = "html.parser"
 from dateutil import parser as dateparser  # لتحليل وتحويل التواريخ النصية
+try:
+    import aiohttp  # طلبات HTTP غير متزامنة: مئات الصفحات في آن واحد بدون خيط لكل طلب
+except ImportError:
+    aiohttp = None
+try:
+    import ahocorasick  # pip install pyahocorasick – كل الكلمات المفتاحية في مرور واحد على النص
+except ImportError:
+    ahocorasick = None
 # -----------------------------
-import spacy  # تحليل لغوي ألماني
-nlp = spacy.load("de_core_news_sm")
+
+
+@lru_cache(maxsize=1)
+def get_nlp():
+    """
+    تحميل النموذج الألماني عند أول استخدام فقط، ومرة واحدة لكل عملية.
+    للنفي يكفي الـ tokenizer، لذا كل المكوّنات معطّلة.
+    """
+    import spacy  # تحليل لغوي ألماني – استيراده بطيء، لذلك لا نستورده إلا عند الحاجة
+    return spacy.load(
+        "de_core_news_sm",
+        disable=["tok2vec", "tagger", "morphologizer", "parser", "lemmatizer", "attribute_ruler", "ner"],
+    )
+
+
 # -----------------------------
 # 2) الإعدادات 
 # -----------------------------
@@ -67,6 +105,18 @@ CONFIG = {
     # مهلة الجلب من الويب والثبات (ثواني)
     "http_timeout": 15,
     "sleep_between_requests": 0.8,
+    # عدد الطلبات المتوازية (الخيوط) لجلب الصفحات إذا لم تكن aiohttp مثبتة
+    "max_workers": 16,
+    # حدود الاتصالات المتزامنة مع aiohttp (الإجمالي / لكل موقع - للتأدب مع الخوادم)
+    "max_connections": 64,
+    "max_connections_per_host": 4,
+    # ذاكرة تخزين مؤقت على القرص لنصوص الصفحات (تجنّب إعادة التحميل خلال 24 ساعة)
+    "page_cache_path": ".page_cache",
+    "page_cache_ttl": 24 * 3600,
+    # الإعلانات التي لم يتغير نصها تأخذ درجتها المحفوظة بدل إعادة التقييم (صلاحية بالأيام)
+    "score_cache_max_age_days": 7,
+    # حفظ ETag/Last-Modified لكل خلاصة RSS: الخلاصات غير المتغيرة تُرجع 304 بدون محتوى
+    "feed_state_path": ".feed_state",
     # User-Agent لتقليل الحظر من بعض المواقع
     "user_agent": (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -75,6 +125,32 @@ CONFIG = {
     ),
 }
 
+# نسخ بأحرف صغيرة من الكلمات المفتاحية والمدن، تُحسب مرة واحدة عند البدء
+CONFIG["_keywords_low"] = [kw.lower() for kw in CONFIG["keywords"]]
+CONFIG["_cities_low"] = [city.lower() for city in CONFIG["user"]["preferred_cities"]]
+
+# جلسة HTTP مشتركة: إعادة استخدام الاتصالات (keep-alive) بدل اتصال جديد لكل طلب
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.3),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+SESSION = _build_session()
+
+# القرص لا يُفتح إلا من خيط واحد في كل مرة (shelve ليس آمناً مع الخيوط)
+_page_cache_lock = threading.Lock()
+
+# آخر موعد طلب لكل نطاق (host) - التهدئة تكون لكل موقع على حدة وليس للبرنامج كله
+_last_fetch: Dict[str, float] = {}
+_last_fetch_lock = threading.Lock()
+
 # --------------------------------------
 # 3) دوال مساعدة: قاعدة البيانات SQLite
 # --------------------------------------
@@ -83,6 +159,8 @@ def init_db(db_path: str) -> None:
     conn = sqlite3.connect(db_path)
     try:
         cur = conn.cursor()
+        # وضع WAL يُحفظ في ملف القاعدة نفسه: كتابة أسرع وقراءة متزامنة أثناء الكتابة
+        cur.execute("PRAGMA journal_mode=WAL;")
         cur.execute(
             """
             CREATE TABLE IF NOT EXISTS jobs (
@@ -99,37 +177,99 @@ def init_db(db_path: str) -> None:
             );
             """
         )
+        # ذاكرة مؤقتة للدرجات: نفس الرابط + نفس بصمة النص = نفس الدرجة
+        cur.execute(
+            """
+            CREATE TABLE IF NOT EXISTS score_cache (
+                link TEXT PRIMARY KEY,
+                content_sha TEXT,
+                score REAL,
+                negated INTEGER NOT NULL DEFAULT 0,
+                scored_at TEXT
+            );
+            """
+        )
         conn.commit()
     finally:
         conn.close()
 
 
-def upsert_job(db_path: str, job: Dict[str, Any]) -> None:
-    """إدراج الوظيفة في القاعدة (تجاهل إذا موجودة بنفس الرابط)."""
+def connect_db(db_path: str) -> sqlite3.Connection:
+    """فتح اتصال واحد طويل العمر بالقاعدة مع إعدادات PRAGMA مناسبة للكتابة المكثفة."""
     conn = sqlite3.connect(db_path)
-    try:
-        cur = conn.cursor()
-        cur.execute(
+    # هذه الإعدادات تخص الاتصال الحالي فقط (وضع WAL يضبطه init_db)
+    conn.execute("PRAGMA synchronous=NORMAL;")
+    conn.execute("PRAGMA temp_store=MEMORY;")
+    conn.execute("PRAGMA cache_size=-20000;")  # ذاكرة صفحات 20 MB
+    conn.execute("PRAGMA mmap_size=268435456;")  # mmap بحجم 256 MB
+    return conn
+
+
+def upsert_jobs_bulk(conn: sqlite3.Connection, jobs: List[Dict[str, Any]]) -> None:
+    """إدراج دفعة من الوظائف في معاملة واحدة (تجاهل الموجود مسبقاً بنفس الرابط)."""
+    if not jobs:
+        return
+    # طابع زمني واحد للدفعة كلها
+    now = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    rows = [
+        (
+            job.get("title"),
+            job.get("company"),
+            job.get("location"),
+            job.get("link"),
+            job.get("published"),
+            job.get("summary"),
+            job.get("score", 0.0),
+            job.get("source"),
+            now,
+        )
+        for job in jobs
+    ]
+    # معاملة واحدة = fsync واحد بدلاً من fsync لكل وظيفة
+    with conn:
+        conn.executemany(
             """
             INSERT OR IGNORE INTO jobs
             (title, company, location, link, published, summary, score, source, created_at)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?);
             """,
-            (
-                job.get("title"),
-                job.get("company"),
-                job.get("location"),
-                job.get("link"),
-                job.get("published"),
-                job.get("summary"),
-                job.get("score", 0.0),
-                job.get("source"),
-                datetime.utcnow().isoformat(timespec="seconds"),
-            ),
+            rows,
         )
-        conn.commit()
-    finally:
-        conn.close()
+
+
+def load_cached_scores(
+    conn: sqlite3.Connection, max_age_days: int
+) -> Dict[str, Tuple[str, float, bool]]:
+    """الدرجات المحفوظة خلال آخر max_age_days يوماً على شكل {link: (content_sha, score, negated)}."""
+    cutoff = (datetime.now(timezone.utc) - timedelta(days=max_age_days)).isoformat(timespec="seconds")
+    cur = conn.execute(
+        "SELECT link, content_sha, score, negated FROM score_cache WHERE scored_at >= ?;", (cutoff,)
+    )
+    return {link: (content_sha, score, bool(negated)) for link, content_sha, score, negated in cur}
+
+
+def save_cached_scores(
+    conn: sqlite3.Connection,
+    entries: List[Dict[str, Any]],
+    results: List[Tuple[float, bool]],
+    max_age_days: int,
+) -> None:
+    """حفظ درجات الإعلانات التي قُيّمت للتو، وحذف الإدخالات المنتهية الصلاحية."""
+    now = datetime.now(timezone.utc)
+    scored_at = now.isoformat(timespec="seconds")
+    cutoff = (now - timedelta(days=max_age_days)).isoformat(timespec="seconds")
+    with conn:
+        conn.executemany(
+            """
+            INSERT OR REPLACE INTO score_cache (link, content_sha, score, negated, scored_at)
+            VALUES (?, ?, ?, ?, ?);
+            """,
+            [
+                (entry["link"], entry["content_sha"], score, int(negated), scored_at)
+                for entry, (score, negated) in zip(entries, results)
+            ],
+        )
+        conn.execute("DELETE FROM score_cache WHERE scored_at < ?;", (cutoff,))
 
 
 def fetch_all_jobs(db_path: str) -> List[Dict[str, Any]]:
@@ -147,9 +287,24 @@ def fetch_all_jobs(db_path: str) -> List[Dict[str, Any]]:
 # ------------------------------
 # 4) دوال: جلب وتحليل الخلاصات
 # ------------------------------
-def fetch_rss_entries(feed_url: str) -> List[Dict[str, Any]]:
-    """قراءة خلاصات RSS وإرجاع قائمة إدخالات (entries)."""
-    parsed = feedparser.parse(feed_url)
+def fetch_rss_entries(feed_url: str) -> Tuple[List[Dict[str, Any]], Optional[Tuple[Any, Any]]]:
+    """
+    قراءة خلاصات RSS وإرجاع (الإدخالات، (etag, modified) الجديدين أو None).
+    الإدخالات فارغة إذا لم تتغير الخلاصة منذ آخر تشغيل.
+    لا تُحفظ القيم الجديدة هنا: يحفظها main() عبر save_feed_state بعد تخزين الإدخالات في القاعدة،
+    وإلا ضاعت الإدخالات إذا توقف البرنامج قبل الحفظ (الخلاصة سترد بـ 304 في المرة القادمة).
+    """
+    import feedparser  # لقراءة خلاصات RSS (يُستورد عند الحاجة فقط)
+
+    with shelve.open(CONFIG["feed_state_path"]) as state:
+        etag, modified = state.get(feed_url, (None, None))
+    parsed = feedparser.parse(feed_url, etag=etag, modified=modified)
+    if parsed.get("status") == 304:
+        # الخلاصة لم تتغير: إدخالاتها محفوظة مسبقاً في قاعدة البيانات
+        return [], None
+    validators = None
+    if parsed.get("etag") or parsed.get("modified"):
+        validators = (parsed.get("etag"), parsed.get("modified"))
     entries = []
     for e in parsed.entries:
         entry = {
@@ -160,12 +315,25 @@ def fetch_rss_entries(feed_url: str) -> List[Dict[str, Any]]:
             "source": feed_url,
         }
         entries.append(entry)
-    return entries
+    return entries, validators
+
+
+def save_feed_state(feed_states: Dict[str, Tuple[Any, Any]]) -> None:
+    """حفظ (etag, modified) لكل خلاصة – فقط بعد أن تُخزَّن إدخالاتها في قاعدة البيانات."""
+    if not feed_states:
+        return
+    with shelve.open(CONFIG["feed_state_path"]) as state:
+        for feed_url, validators in feed_states.items():
+            state[feed_url] = validators
 
 
 def extract_published(entry: Any) -> str:
     """محاولة استخراج تاريخ النشر من عناصر RSS المختلفة وتحويله لصيغة ISO."""
-    # نحاول عدة حقول محتملة
+    # feedparser يحلّل التاريخ مسبقاً (struct_time بتوقيت UTC) – أسرع بكثير من dateutil
+    parsed = entry.get("published_parsed") or entry.get("updated_parsed")
+    if parsed:
+        return datetime(*parsed[:6], tzinfo=timezone.utc).isoformat(timespec="seconds")
+    # وإلا نحاول عدة حقول محتملة
     for key in ("published", "updated", "created"):
         val = entry.get(key)
         if val:
@@ -175,26 +343,138 @@ def extract_published(entry: Any) -> str:
             except Exception:
                 pass
     # إذا لم نجد تاريخاً صالحاً، نستخدم تاريخ اليوم
-    return datetime.utcnow().isoformat(timespec="seconds")
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def throttle_host(url: str, min_interval: float) -> None:
+    """الانتظار حتى يحين دور هذا النطاق، بحيث يفصل بين طلبين لنفس الموقع min_interval ثانية."""
+    host = urlparse(url).netloc
+    with _last_fetch_lock:
+        now = time.monotonic()
+        slot = max(now, _last_fetch.get(host, now - min_interval) + min_interval)
+        _last_fetch[host] = slot
+    if slot > now:
+        time.sleep(slot - now)
+
+
+def _page_cache_get(key: str) -> Optional[str]:
+    """قراءة نص صفحة من التخزين المؤقت على القرص (None إذا غير موجود أو منتهي الصلاحية)."""
+    try:
+        with _page_cache_lock, shelve.open(CONFIG["page_cache_path"]) as cache:
+            item = cache.get(key)
+    except Exception:
+        return None
+    if item is None:
+        return None
+    stored_at, blob = item
+    if time.time() - stored_at > CONFIG["page_cache_ttl"]:
+        return None
+    return zlib.decompress(blob).decode("utf-8")
+
+
+def _page_cache_put(key: str, text: str) -> None:
+    """حفظ النص المستخرج (وليس HTML الخام) مضغوطاً على القرص."""
+    try:
+        with _page_cache_lock, shelve.open(CONFIG["page_cache_path"]) as cache:
+            cache[key] = (time.time(), zlib.compress(text.encode("utf-8")))
+    except Exception:
+        pass
 
 
 def fetch_page_text(url: str, timeout: int, ua: str) -> str:
-    """جلب صفحة الويب واستخراج نصها (بدون وسوم HTML)."""
+    """جلب صفحة الويب واستخراج نصها (بدون وسوم HTML)، مع تخزين مؤقت في الذاكرة وعلى القرص."""
+    return _fetch_page_text_cached(url, timeout, ua)
+
+
+@lru_cache(maxsize=4096)
+def _fetch_page_text_cached(url: str, timeout: int, ua: str) -> str:
+    key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    text = _page_cache_get(key)
+    if text is None:
+        text = _download_page_text(url, timeout, ua)
+        if text:
+            _page_cache_put(key, text)
+    return text
+
+
+def _download_page_text(url: str, timeout: int, ua: str) -> str:
+    """تحميل الصفحة فعلياً من الويب واستخراج النص."""
     try:
         headers = {"User-Agent": ua}
-        resp = requests.get(url, timeout=timeout, headers=headers)
+        throttle_host(url, CONFIG["sleep_between_requests"])
+        resp = SESSION.get(url, timeout=timeout, headers=headers)
         resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
-        # إزالة السكربتات والستايلات
-        for bad in soup(["script", "style", "noscript"]):
-            bad.decompose()
-        text = soup.get_text(separator=" ", strip=True)
+        return html_to_text(resp.text)
+    except Exception:
+        return ""
+
+
+async def fetch_page_text_async(session: "aiohttp.ClientSession", url: str) -> str:
+    """النسخة غير المتزامنة من fetch_page_text (تستخدم نفس التخزين المؤقت على القرص)."""
+    key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    text = _page_cache_get(key)
+    if text is not None:
         return text
+    try:
+        async with session.get(url) as resp:
+            resp.raise_for_status()
+            html = await resp.text()
     except Exception:
         return ""
+    text = html_to_text(html)
+    if text:
+        _page_cache_put(key, text)
+    return text
+
+
+async def crawl_all(urls: List[str], cfg: Dict[str, Any]) -> List[str]:
+    """تحميل كل الصفحات بالتوازي؛ الحد لكل موقع (limit_per_host) يحل محل الانتظار بين الطلبات."""
+    connector = aiohttp.TCPConnector(
+        limit=cfg["max_connections"],
+        limit_per_host=cfg["max_connections_per_host"],
+    )
+    timeout = aiohttp.ClientTimeout(total=cfg["http_timeout"])
+    headers = {"User-Agent": cfg["user_agent"]}
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=headers) as session:
+        return await asyncio.gather(*(fetch_page_text_async(session, url) for url in urls))
+
+
+def fetch_all_pages(urls: List[str], cfg: Dict[str, Any]) -> List[str]:
+    """نصوص كل الروابط بنفس الترتيب (كل رابط يُحمّل مرة واحدة فقط حتى لو تكرر)."""
+    unique = list(dict.fromkeys(urls))
+    if aiohttp is not None:
+        texts = asyncio.run(crawl_all(unique, cfg))
+    else:
+        with ThreadPoolExecutor(max_workers=cfg["max_workers"]) as pool:
+            texts = list(pool.map(
+                lambda url: fetch_page_text(url, cfg["http_timeout"], cfg["user_agent"]), unique
+            ))
+    pages = dict(zip(unique, texts))
+    return [pages[url] for url in urls]
+
+
+def html_to_text(html: str) -> str:
+    """استخراج النص المرئي من HTML (selectolax إن وُجد، وإلا BeautifulSoup)."""
+    if HTMLParser is not None:
+        tree = HTMLParser(html)
+        # إزالة السكربتات والستايلات
+        for bad in tree.css("script, style, noscript"):
+            bad.decompose()
+        root = tree.body or tree.root
+        return root.text(separator=" ", strip=True) if root is not None else ""
+
+    soup = BeautifulSoup(html, _BS_PARSER)
+    # إزالة السكربتات والستايلات
+    for bad in soup(["script", "style", "noscript"]):
+        bad.decompose()
+    return soup.get_text(separator=" ", strip=True)
     # ---------------------------------
 # 🔍 NEU: Websuche (deutschlandweite Jobs über Google)
 # ---------------------------------
+# روابط نتائج Google بالشكل href="/url?q=<الرابط>&..." – مسح واحد للنص بدل بناء شجرة HTML كاملة
+_GOOGLE_LINK_RE = re.compile(r'href="/url\?q=(https?://[^&"]+)')
+
+
 def search_jobs_online(query: str, max_results: int = 15) -> list:
     """
     Sucht Jobs direkt über Google (nicht nur RSS).
@@ -203,28 +483,31 @@ def search_jobs_online(query: str, max_results: int = 15) -> list:
     from urllib.parse import quote
     url = f"https://www.google.com/search?q={quote(query)}+site:indeed.com+OR+site:stepstone.de+OR+site:adzuna.de+OR+site:workwise.io+OR+site:kimeta.de"
     headers = {"User-Agent": "Mozilla/5.0"}
-    resp = requests.get(url, headers=headers)
-    soup = BeautifulSoup(resp.text, "html.parser")
+    throttle_host(url, CONFIG["sleep_between_requests"])
+    resp = SESSION.get(url, headers=headers, timeout=10)
 
     links = []
-    for a in soup.select("a"):
-        href = a.get("href", "")
-        if href.startswith("/url?q="):
-            clean = href.split("/url?q=")[1].split("&")[0]
-            if "http" in clean and "google" not in clean:
-                links.append(clean)
-    return links[:max_results]
+    seen = set()
+    for link in _GOOGLE_LINK_RE.findall(resp.text):
+        if "google" not in link and link not in seen:
+            seen.add(link)
+            links.append(link)
+            if len(links) >= max_results:
+                break
+    return links
 
 
 # ---------------------------------
 # 5) دوال: التحليل وتوليد النقاط
 # ---------------------------------
-def safe_lower(s: str) -> str:
-    """Wandelt den Text sicher in Kleinbuchstaben um."""
-    try:
-        return s.lower()
-    except Exception:
-        return s
+NEG_WORDS = frozenset({"kein", "keine", "keinen", "keiner", "nicht", "nie", "niemals"})
+# Verneinungen stehen in Stellenanzeigen fast immer im ersten Absatz
+NEGATION_WINDOW = 2000
+
+
+def _has_negation_word(doc) -> bool:
+    # token.lower_ ist bei spaCy bereits vorberechnet – keine neue Zeichenkette pro Token
+    return any(token.lower_ in NEG_WORDS for token in doc)
 
 
 def contains_negation(text: str) -> bool:
@@ -232,30 +515,117 @@ def contains_negation(text: str) -> bool:
     Prüft, ob der Text eine Verneinung enthält (z. B. kein, keine, keinen, nicht).
     Gibt True zurück, wenn eine Verneinung erkannt wird.
     """
-    doc = nlp(text)
-    for token in doc:
-        # dep_ == "neg" bedeutet, das Wort ist eine Verneinung im Satz
-        if token.dep_ == "neg" or token.text.lower() in ["kein", "keine", "keinen", "nicht"]:
-            return True
-    return False
+    # make_doc = nur Tokenizer, ohne Tagger/Parser
+    return _has_negation_word(get_nlp().make_doc(text[:NEGATION_WINDOW]))
+
+
+@lru_cache(maxsize=None)
+def _build_automaton(words: Tuple[str, ...]):
+    """بناء آلة Aho-Corasick لقائمة كلمات (مرة واحدة لكل قائمة). القيمة = عدد تكرار الكلمة في القائمة."""
+    automaton = ahocorasick.Automaton()
+    for word in words:
+        word_low = word.lower()
+        automaton.add_word(word_low, automaton.get(word_low, 0) + 1)
+    automaton.make_automaton()
+    return automaton
+
+
+def _count_with_automaton(text_low: str, words: List[str]) -> int:
+    """عدّ كل مواضع ظهور الكلمات في مرور واحد على النص."""
+    if not words:
+        return 0
+    return sum(n for _, n in _build_automaton(tuple(words)).iter(text_low))
+
+
+@lru_cache(maxsize=None)
+def _build_pattern(words: Tuple[str, ...]):
+    """بديل عند غياب pyahocorasick: تعبير نمطي واحد يجمع كل الكلمات (الأطول أولاً)."""
+    counts = Counter(word.lower() for word in words)
+    alternation = "|".join(re.escape(w) for w in sorted(counts, key=len, reverse=True))
+    return re.compile(alternation), counts
+
+
+def _count_with_pattern(text_low: str, words: List[str]) -> int:
+    """عدّ مواضع ظهور الكلمات بمرور واحد على النص عبر التعبير النمطي المجمّع."""
+    if not words:
+        return 0
+    pattern, counts = _build_pattern(tuple(words))
+    return sum(counts[match] for match in pattern.findall(text_low))
+
+
+def count_keyword_hits(text_low: str, keywords_low: List[str]) -> int:
+    """عدّ مرات ظهور الكلمات المفتاحية في النص (بشكل تقريبي). النص والكلمات بأحرف صغيرة مسبقاً."""
+    # عدّ كنصوص جزئية بلا حدود كلمات - مقصود، حتى تبقى النقاط كما في النسخة الأصلية
+    if ahocorasick is not None:
+        return _count_with_automaton(text_low, keywords_low)
+    return _count_with_pattern(text_low, keywords_low)
+
+
+def boost_for_city(text_low: str, cities_low: List[str]) -> int:
+    """زيادة نقاط إذا ظهر اسم مدينة مفضّلة في النص. النص والمدن بأحرف صغيرة مسبقاً."""
+    if ahocorasick is not None:
+        return _count_with_automaton(text_low, cities_low)
+    return _count_with_pattern(text_low, cities_low)
+
+
+@lru_cache(maxsize=None)
+def _build_scan_automaton(keywords: Tuple[str, ...], cities: Tuple[str, ...]):
+    """
+    آلة واحدة تعرف الكلمات المفتاحية والمدن وكلمات النفي معاً.
+    القيمة لكل كلمة: (عدد مرات وجودها في keywords، في cities، هل هي كلمة نفي، طولها).
+    """
+    automaton = ahocorasick.Automaton()
+
+    def add(word: str, kw: int = 0, city: int = 0, neg: bool = False) -> None:
+        word_low = word.lower()
+        old_kw, old_city, old_neg, _ = automaton.get(word_low, (0, 0, False, 0))
+        automaton.add_word(word_low, (old_kw + kw, old_city + city, old_neg or neg, len(word_low)))
+
+    for word in keywords:
+        add(word, kw=1)
+    for word in cities:
+        add(word, city=1)
+    for word in NEG_WORDS:
+        add(word, neg=True)
+    automaton.make_automaton()
+    return automaton
+
+
+def _is_whole_word(text: str, start: int, end: int) -> bool:
+    """هل الموضع text[start:end+1] كلمة كاملة؟ (وإلا لوجدنا "nie" داخل "Ingenieur")"""
+    return (start == 0 or not text[start - 1].isalnum()) and (
+        end + 1 == len(text) or not text[end + 1].isalnum()
+    )
 
 
-def count_keyword_hits(text: str, keywords: List[str]) -> int:
-    """عدّ مرات ظهور الكلمات المفتاحية في النص (بشكل تقريبي)."""
-    text_low = safe_lower(text)
-    score = 0
-    for kw in keywords:
-        kw_low = kw.lower()
-        # نستخدم بحثاً بسيطاً (يمكن تطويره لاحقاً إلى Regex بكلمات كاملة)
-        hits = text_low.count(kw_low)
-        score += hits
-    return score
+def scan_text(text_low: str, keywords_low: List[str], cities_low: List[str]) -> Tuple[int, int, bool]:
+    """
+    مرور واحد على النص (بأحرف صغيرة) بدل ثلاثة (نفي + كلمات مفتاحية + مدن).
+    يُرجع (عدد الكلمات المفتاحية، عدد المدن، هل وُجد نفي في أول NEGATION_WINDOW حرف).
+    """
+    if ahocorasick is None:
+        return (
+            count_keyword_hits(text_low, keywords_low),
+            boost_for_city(text_low, cities_low),
+            contains_negation(text_low),
+        )
 
+    kw_hits = city_hits = 0
+    automaton = _build_scan_automaton(tuple(keywords_low), tuple(cities_low))
+    for end, (kw, city, neg, length) in automaton.iter(text_low):
+        kw_hits += kw
+        city_hits += city
+        if neg:
+            start = end - length + 1
+            if start < NEGATION_WINDOW and _is_whole_word(text_low, start, end):
+                # مع النفي لا تهم النقاط، فلا حاجة لإكمال المسح
+                return kw_hits, city_hits, True
+    return kw_hits, city_hits, False
 
-def boost_for_city(text: str, preferred_cities: List[str]) -> int:
-    """زيادة نقاط إذا ظهر اسم مدينة مفضّلة في النص."""
-    text_low = safe_lower(text)
-    return sum(text_low.count(city.lower()) for city in preferred_cities)
+
+# أنماط البحث تُترجم مرة واحدة عند تحميل الوحدة
+_LOC_RE = re.compile(r"\b(Berlin|Dresden|München|Munich|Hamburg|Erlangen|Nürnberg|Frankfurt|Stuttgart|Leipzig)\b")
+_COMP_RE = re.compile(r"\b([A-Z][A-Za-z0-9&.\- ]{1,40})\s+(GmbH|AG|SE|KG|GmbH & Co\. KG)")
 
 
 def heuristic_company_location(title: str, summary: str) -> (str, str):
@@ -265,75 +635,168 @@ def heuristic_company_location(title: str, summary: str) -> (str, str):
     """
     combined = f"{title} // {summary}"
     # محاولة استخراج المدينة (كلمات تنتهي بـ GmbH ليست مدن!)
-    loc_match = re.search(r"\b(Berlin|Dresden|München|Munich|Hamburg|Erlangen|Nürnberg|Frankfurt|Stuttgart|Leipzig)\b", combined)
+    loc_match = _LOC_RE.search(combined)
     location = loc_match.group(0) if loc_match else ""
 
     # محاولة استخراج الشركة (كلمات قبل GmbH/AG/SE وما شابه)
-    comp_match = re.search(r"\b([A-Z][A-Za-z0-9&.\- ]{1,40})\s+(GmbH|AG|SE|KG|GmbH & Co\. KG)", combined)
+    comp_match = _COMP_RE.search(combined)
     company = comp_match.group(0) if comp_match else ""
 
     return company, location
 
 
-def score_job_entry(entry: Dict[str, Any], cfg: Dict[str, Any]) -> Dict[str, Any]:
-    """Berechnet die Punktzahl einer Stelle und bereitet die Felder (Firma/Stadt/Zusammenfassung) vor."""
-    
-    title = entry.get("title", "")
-    summary = entry.get("summary", "")
-    link = entry.get("link", "")
-    published = entry.get("published", "")
-    source = entry.get("source", "")
+def build_search_entry(query: str, link: str, page_text: str) -> Optional[Dict[str, Any]]:
+    """Erzeugt aus einem Treffer der Websuche einen Eintrag (None, wenn die Seite leer ist)."""
+    if not page_text:
+        return None
+    return {
+        "title": query,
+        "link": link,
+        "summary": page_text[:500],
+        "published": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "source": "Google Search",
+    }
+
+
+def fetch_job_text(entry: Dict[str, Any], cfg: Dict[str, Any]) -> str:
+    """Lädt den Seitentext einer Stelle und liefert Titel, Zusammenfassung und Seitentext zusammen."""
+    page_text = ""
+    if _worth_fetching(entry, cfg):
+        # Versucht, den vollständigen Text der Webseite zu laden, um die Genauigkeit zu erhöhen
+        page_text = fetch_page_text(entry.get("link", ""), cfg["http_timeout"], cfg["user_agent"])
+    return _combine_text(entry, page_text)
+
+
+def _worth_fetching(entry: Dict[str, Any], cfg: Dict[str, Any]) -> bool:
+    """
+    Die Seite wird nur geladen, wenn Titel oder Zusammenfassung schon ein Schlüsselwort enthalten –
+    ohne Treffer dort rettet der Seitentext die Bewertung fast nie.
+    """
+    text_low = f"{entry.get('title', '')} {entry.get('summary', '')}".lower()
+    return count_keyword_hits(text_low, cfg["_keywords_low"]) > 0
+
+
+def _combine_text(entry: Dict[str, Any], page_text: str) -> str:
+    return " ".join([entry.get("title", ""), entry.get("summary", ""), page_text])
+
 
-    # Versucht, den vollständigen Text der Webseite zu laden, um die Genauigkeit zu erhöhen
-    page_text = fetch_page_text(link, cfg["http_timeout"], cfg["user_agent"])
-    combined_text = " ".join([title, summary, page_text])
+def _with_text(entry: Dict[str, Any], page_text: str) -> Dict[str, Any]:
+    """نسخة من الإدخال مع النص الكامل ("text") وبصمته ("content_sha") لذاكرة الدرجات."""
+    text = _combine_text(entry, page_text)
+    content_sha = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+    return {**entry, "text": text, "content_sha": content_sha}
+
+
+def fetch_stage(
+    entries: List[Dict[str, Any]],
+    search_hits: List[Tuple[str, str]],
+    cfg: Dict[str, Any],
+) -> List[Dict[str, Any]]:
+    """
+    مرحلة الإدخال/الإخراج: تحميل صفحات RSS ونتائج البحث دفعة واحدة،
+    وإرجاع الإدخالات مع النص الكامل وبصمته (انظر _with_text).
+    """
+    wanted = [i for i, e in enumerate(entries) if _worth_fetching(e, cfg)]
+    urls = [entries[i]["link"] for i in wanted] + [link for _, link in search_hits]
+    pages = fetch_all_pages(urls, cfg)
+
+    rss_pages = [""] * len(entries)
+    for i, page in zip(wanted, pages):
+        rss_pages[i] = page
+    fetched = [_with_text(e, page) for e, page in zip(entries, rss_pages)]
+    for (query, link), page in zip(search_hits, pages[len(wanted):]):
+        entry = build_search_entry(query, link, page)
+        if entry is not None:
+            fetched.append(_with_text(entry, page))
+    return fetched
+
+
+def score_stage(batch: List[Dict[str, Any]], cfg: Dict[str, Any]) -> List[Tuple[float, bool]]:
+    """
+    مرحلة الحساب: تقييم كل الإعلانات التي لم تُؤخذ درجتها من الذاكرة المؤقتة.
+    تُرجع (النقاط، هل وُجد نفي) لكل إعلان؛ الحقول تُبنى لاحقاً عبر _build_job_row.
+    """
+    return [score_text(e, cfg, e["text"]) for e in batch]
+
+
+def score_text(entry: Dict[str, Any], cfg: Dict[str, Any], combined_text: str) -> Tuple[float, bool]:
+    """
+    Berechnet nur die Punktzahl einer Stelle: (Punkte, Verneinung gefunden).
+    """
+    # Verneinung, Schlüsselwörter und Städte in einem einzigen Durchlauf (Kleinschreibung nur einmal)
+    base_score, city_boost, negated = scan_text(
+        combined_text.lower(), cfg["_keywords_low"], cfg["_cities_low"]
+    )
 
     # 🔍 Neue Funktion: prüft, ob der Text eine Verneinung enthält (z. B. kein, nicht, ...)
-    if contains_negation(combined_text):
-        print(f"⏩ Anzeige übersprungen (enthält Verneinung): {title}")
-        return {
-            "title": title,
-            "company": "",
-            "location": "",
-            "link": link,
-            "published": published,
-            "summary": summary,
-            "score": 0.0,   # keine Punkte, weil irrelevant
-            "source": source,
-        }
+    if negated:
+        print(f"⏩ Anzeige übersprungen (enthält Verneinung): {entry.get('title', '')}")
+        return 0.0, True   # keine Punkte, weil irrelevant
 
     # Wenn keine Verneinung vorhanden ist → Punkte normal berechnen
-    base_score = count_keyword_hits(combined_text, cfg["keywords"])
-    city_boost = boost_for_city(combined_text, cfg["user"]["preferred_cities"])
-    final_score = base_score + city_boost
+    return float(base_score + city_boost), False
 
-    company, location = heuristic_company_location(title, summary)
 
-    # Kürzere Zusammenfassung
-    short_summary = (summary[:280] + "…") if len(summary) > 300 else summary
+def _build_job_row(entry: Dict[str, Any], score: float, negated: bool) -> Dict[str, Any]:
+    """
+    Bereitet die Felder einer Stelle (Firma/Stadt/Zusammenfassung) für die Datenbank vor –
+    gleich, ob die Punktzahl frisch berechnet oder aus score_cache übernommen wurde.
+    """
+    title = entry.get("title", "")
+    summary = entry.get("summary", "")
+
+    if negated:
+        company, location, short_summary = "", "", summary
+    else:
+        company, location = heuristic_company_location(title, summary)
+        # Kürzere Zusammenfassung
+        short_summary = (summary[:280] + "…") if len(summary) > 300 else summary
 
     return {
         "title": title,
         "company": company,
         "location": location,
-        "link": link,
-        "published": published,
+        "link": entry.get("link", ""),
+        "published": entry.get("published", ""),
         "summary": short_summary,
-        "score": float(final_score),
-        "source": source,
+        "score": float(score),
+        "source": entry.get("source", ""),
     }
 
+
+def score_job_entry(
+    entry: Dict[str, Any],
+    cfg: Dict[str, Any],
+    combined_text: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Berechnet die Punktzahl einer Stelle und bereitet die Felder (Firma/Stadt/Zusammenfassung) vor.
+    combined_text kann bereits geladen übergeben werden (siehe fetch_stage).
+    """
+    if combined_text is None:
+        combined_text = fetch_job_text(entry, cfg)
+    score, negated = score_text(entry, cfg, combined_text)
+    return _build_job_row(entry, score, negated)
+
 # ----------------------------------------
 # 6) التصدير إلى CSV وتوليد خطابات التقديم
 # ----------------------------------------
 def export_to_csv(db_path: str, csv_path: str) -> None:
-    """تصدير كل الوظائف إلى ملف CSV مرتّبة حسب النقاط."""
-    rows = fetch_all_jobs(db_path)
-    if not rows:
-        print("لا توجد وظائف لحفظها بعد.")
-        return
-    df = pd.DataFrame(rows)
-    df.to_csv(csv_path, index=False, quoting=csv.QUOTE_ALL)
+    """تصدير كل الوظائف إلى ملف CSV مرتّبة حسب النقاط (صفاً بصف دون تحميل الجدول كاملاً في الذاكرة)."""
+    conn = sqlite3.connect(db_path)
+    try:
+        cur = conn.execute("SELECT * FROM jobs ORDER BY score DESC, published DESC;")
+        first = cur.fetchone()
+        if first is None:
+            print("لا توجد وظائف لحفظها بعد.")
+            return
+        with open(csv_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+            writer.writerow([col[0] for col in cur.description])
+            writer.writerow(first)
+            writer.writerows(cur)  # المؤشر يُقرأ تدريجياً
+    finally:
+        conn.close()
     print(f"✅ تم إنشاء الملف: {csv_path}")
 
 
@@ -389,17 +852,16 @@ def main():
     # -------------------------------
     # 1️⃣ RSS-Feeds (wie bisher)
     # -------------------------------
-    total_found = 0
+    entries: List[Dict[str, Any]] = []
+    # ETag/Last-Modified erst speichern, wenn die Einträge in der Datenbank sind
+    feed_states: Dict[str, Tuple[Any, Any]] = {}
     for feed in CONFIG["feeds"]:
         print(f"📥 Lese RSS-Feed: {feed}")
-        entries = fetch_rss_entries(feed)
-        print(f"  ↳ {len(entries)} Einträge gefunden.")
-
-        for e in entries:
-            job_row = score_job_entry(e, CONFIG)
-            upsert_job(CONFIG["db_path"], job_row)
-            total_found += 1
-            time.sleep(CONFIG["sleep_between_requests"])
+        feed_entries, validators = fetch_rss_entries(feed)
+        print(f"  ↳ {len(feed_entries)} Einträge gefunden.")
+        entries.extend(feed_entries)
+        if validators is not None:
+            feed_states[feed] = validators
 
     # -------------------------------
     # 2️⃣ Neue Online-Suche (Google)
@@ -412,32 +874,46 @@ def main():
         "Python Developer MedTech",
     ]
 
+    search_hits = []
     for query in keywords_to_search:
         print(f"🔎 Suche: {query}")
         links = search_jobs_online(query)
         print(f"  ↳ {len(links)} Ergebnisse gefunden.")
+        search_hits.extend((query, link) for link in links)
 
-        for link in links:
-            page_text = fetch_page_text(link, CONFIG["http_timeout"], CONFIG["user_agent"])
-            if not page_text:
-                continue
+    # Alle Seiten parallel laden
+    fetched = fetch_stage(entries, search_hits, CONFIG)
+    max_age_days = CONFIG["score_cache_max_age_days"]
 
-            entry = {
-                "title": query,
-                "link": link,
-                "summary": page_text[:500],
-                "published": datetime.utcnow().isoformat(timespec="seconds"),
-                "source": "Google Search",
-            }
+    conn = connect_db(CONFIG["db_path"])
+    try:
+        # Unveränderte Anzeigen übernehmen ihre gespeicherte Punktzahl
+        cached = load_cached_scores(conn, max_age_days)
+        job_rows, to_score = [], []
+        for e in fetched:
+            hit = cached.get(e["link"])
+            if hit is not None and hit[0] == e["content_sha"]:
+                job_rows.append(_build_job_row(e, hit[1], hit[2]))
+            else:
+                to_score.append(e)
+
+        # Direkt bewerten: ein Scan-Durchlauf pro Anzeige kostet weniger als das Verschicken an Prozesse
+        results = score_stage(to_score, CONFIG)
+        save_cached_scores(conn, to_score, results, max_age_days)
+        job_rows.extend(
+            _build_job_row(e, score, negated) for e, (score, negated) in zip(to_score, results)
+        )
 
-            job_row = score_job_entry(entry, CONFIG)
-            upsert_job(CONFIG["db_path"], job_row)
-            total_found += 1
-            time.sleep(CONFIG["sleep_between_requests"])
+        # -------------------------------
+        # 3️⃣ Ergebnisse anzeigen und speichern
+        # -------------------------------
+        upsert_jobs_bulk(conn, job_rows)
+    finally:
+        conn.close()
+    # Erst jetzt (nach dem Commit) gelten die Feeds als verarbeitet
+    save_feed_state(feed_states)
+    total_found = len(job_rows)
 
-    # -------------------------------
-    # 3️⃣ Ergebnisse anzeigen und speichern
-    # -------------------------------
     print(f"\n✅ Gesamtanzahl verarbeiteter Anzeigen: {total_found}")
 
     rows = fetch_all_jobs(CONFIG["db_path"])[:10]
@@ -11,22 +11,50 @@ Autor: Saddam Wahan
 Datum: Oktober 2025
 """
 
+import asyncio
 import os
 import re
 import csv
 import sqlite3
+import threading
 import time
 import logging
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
-from urllib.parse import quote
+from urllib.parse import quote, urlparse
 
-import feedparser
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
-import pandas as pd
 from dateutil import parser as dateparser
-import spacy
+
+# Optional: aiohttp hält viele Seitenabrufe gleichzeitig offen, ohne Thread pro Anfrage
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Optional: selectolax ist ein HTML-Parser in C, deutlich schneller als html.parser
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
+
+# Optional: HTTP-Cache auf der Platte, beachtet ETag/Last-Modified (pip install requests-cache)
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+# Optional: Aho-Corasick-Automat für Städtelisten (pip install pyahocorasick)
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 # Logging-Konfiguration für bessere Fehlersuche
 logging.basicConfig(
@@ -35,14 +63,6 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Deutsches Sprachmodell laden
-try:
-    nlp = spacy.load("de_core_news_sm")
-except OSError:
-    logger.error("Spacy-Modell 'de_core_news_sm' nicht gefunden. Bitte installieren mit: python -m spacy download de_core_news_sm")
-    raise
-
-
 # =============================================================================
 # KONFIGURATION
 # =============================================================================
@@ -83,7 +103,15 @@ CONFIG = {
     "db_path": "jobs.db",
     "csv_path": "jobs_export.csv",
     "http_timeout": 15,
-    "sleep_between_requests": 1.0,
+    "max_page_chars": 5000,  # Seitentext wird danach abgeschnitten (begrenzt den Scan-Aufwand)
+    "sleep_between_requests": 1.0,  # Mindestabstand pro Host, nicht global
+    "max_workers": 16,  # Thread-Pool, falls aiohttp nicht installiert ist
+    "max_connections": 64,  # aiohttp: gleichzeitige Verbindungen insgesamt
+    "max_connections_per_host": 4,  # aiohttp: gleichzeitige Verbindungen pro Host
+    "http_cache_path": ".http_cache",  # requests-cache (SQLite-Datei)
+    "http_cache_expire": 3600,  # Sekunden, danach wird per ETag neu validiert
+    "refetch_after_hours": 24,  # bereits gespeicherte Links erst danach erneut laden
+    "page_cache_max_age_days": 7,  # fetched_pages: ältere Einträge werden gelöscht (> refetch_after_hours)
     "user_agent": (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
         "AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -91,6 +119,76 @@ CONFIG = {
     ),
 }
 
+# Vorkompilierte Muster - werden einmal beim Laden des Moduls gebaut statt pro Anzeige
+LOCATION_CITIES = (
+    "Berlin", "Dresden", "München", "Munich", "Hamburg", "Erlangen", "Nürnberg",
+    "Frankfurt", "Stuttgart", "Leipzig", "Köln", "Düsseldorf", "Hannover",
+)
+_LOCATION_RE = re.compile(r'\b(' + '|'.join(LOCATION_CITIES) + r')\b', re.IGNORECASE)
+_COMPANY_RE = re.compile(
+    r'\b([A-ZÄÖÜ][A-Za-zÄÖÜäöüß0-9&.\- ]{2,40})\s+(GmbH|AG|SE|KG|GmbH & Co\.\s*KG|e\.V\.|Inc\.|Ltd\.)'
+)
+_SAFE_TITLE_RE = re.compile(r'[^\w\s-]')
+
+
+def _build_session() -> requests.Session:
+    """
+    Erstellt eine HTTP-Session mit Verbindungspool für alle Anfragen.
+    
+    Mit requests-cache werden Antworten auf der Platte gehalten; unveränderte
+    Seiten kommen dann per 304 aus dem Cache statt erneut übers Netz.
+    
+    Returns:
+        Konfigurierte requests.Session
+    """
+    if requests_cache is not None:
+        session = requests_cache.CachedSession(
+            CONFIG["http_cache_path"],
+            backend="sqlite",
+            expire_after=CONFIG["http_cache_expire"],
+            allowable_methods=("GET",),
+            stale_if_error=True,
+        )
+    else:
+        session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.3),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Gemeinsame Session - hält Verbindungen offen statt pro Anfrage neu aufzubauen.
+# Wird erst beim ersten Gebrauch angelegt (siehe _get_session), damit ein bloßer
+# Import keine Cache-Datei im Arbeitsverzeichnis erzeugt.
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """
+    Liefert die gemeinsame HTTP-Session und legt sie beim ersten Aufruf an.
+    
+    Returns:
+        Konfigurierte requests.Session
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = _build_session()
+    return _session
+
+# Letzter Anfragezeitpunkt pro Host, damit die Pause nur gleiche Server betrifft
+_last_fetch: Dict[str, float] = {}
+_last_fetch_lock = threading.Lock()
+
+# Schlüsselwörter und Städte in Kleinschreibung - einmal beim Start statt pro Anzeige
+CONFIG["_keywords_lower"] = [k.lower() for k in CONFIG["keywords"]]
+CONFIG["_cities_lower"] = [c.lower() for c in CONFIG["user"]["preferred_cities"]]
+
 
 # =============================================================================
 # DATENBANKFUNKTIONEN
@@ -105,6 +203,8 @@ def init_db(db_path: str) -> None:
     """
     conn = sqlite3.connect(db_path)
     try:
+        # WAL bleibt in der Datei gespeichert - einmal setzen reicht
+        conn.execute("PRAGMA journal_mode=WAL")
         cur = conn.cursor()
         cur.execute("""
             CREATE TABLE IF NOT EXISTS jobs (
@@ -122,9 +222,33 @@ def init_db(db_path: str) -> None:
             );
         """)
         
+        # Ältere Datenbanken haben die Spalte last_updated noch nicht
+        columns = {row[1] for row in cur.execute("PRAGMA table_info(jobs)")}
+        if "last_updated" not in columns:
+            cur.execute("ALTER TABLE jobs ADD COLUMN last_updated TEXT")
+        
+        # Jede geladene Seite - auch irrelevante - mit Zeitpunkt und ETag/Last-Modified,
+        # damit spätere Läufe sie überspringen oder per bedingtem GET prüfen können
+        cur.execute("""
+            CREATE TABLE IF NOT EXISTS fetched_pages (
+                link TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                page_text TEXT,
+                fetched_at TEXT NOT NULL
+            );
+        """)
+        
         # Index für schnellere Abfragen
+        # (link braucht keinen eigenen Index - UNIQUE legt bereits einen an)
+        # Deckt ORDER BY score DESC, published DESC komplett ab (kein extra Sortierschritt);
+        # der alte reine Score-Index ist damit überflüssig
+        cur.execute("""
+            CREATE INDEX IF NOT EXISTS idx_score_published ON jobs(score DESC, published DESC);
+        """)
+        cur.execute("DROP INDEX IF EXISTS idx_score")
         cur.execute("""
-            CREATE INDEX IF NOT EXISTS idx_score ON jobs(score DESC);
+            CREATE INDEX IF NOT EXISTS idx_published ON jobs(published);
         """)
         
         conn.commit()
@@ -136,69 +260,198 @@ def init_db(db_path: str) -> None:
         conn.close()
 
 
-def upsert_job(db_path: str, job: Dict[str, Any]) -> bool:
+def connect_db(db_path: str) -> sqlite3.Connection:
     """
-    Fügt eine neue Stellenanzeige in die Datenbank ein oder aktualisiert sie.
+    Öffnet eine Datenbankverbindung, die über viele Schreibvorgänge hinweg
+    wiederverwendet wird (SQLite cached die vorbereiteten Statements pro Verbindung).
     
     Args:
         db_path: Pfad zur Datenbankdatei
-        job: Dictionary mit Stelleninformationen
         
     Returns:
-        True wenn erfolgreich eingefügt, False wenn bereits vorhanden
+        Offene Verbindung - muss vom Aufrufer geschlossen werden
     """
     conn = sqlite3.connect(db_path)
-    try:
-        cur = conn.cursor()
+    # Im WAL-Modus reicht NORMAL: kein fsync pro Commit, nur beim Checkpoint
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+def _existing_links(conn: sqlite3.Connection, links: List[str], chunk_size: int = 500) -> set:
+    """
+    Prüft über den UNIQUE-Index auf link, welche Links bereits gespeichert sind.
+    
+    Args:
+        conn: Offene Datenbankverbindung
+        links: Zu prüfende Links
+        chunk_size: Links pro Abfrage (SQLite begrenzt die Anzahl der Parameter)
         
-        # Prüfen, ob Job bereits existiert
-        cur.execute("SELECT id FROM jobs WHERE link = ?", (job.get("link"),))
-        existing = cur.fetchone()
+    Returns:
+        Menge der bereits vorhandenen Links
+    """
+    existing = set()
+    for start in range(0, len(links), chunk_size):
+        chunk = links[start:start + chunk_size]
+        placeholders = ",".join("?" * len(chunk))
+        cur = conn.execute(f"SELECT link FROM jobs WHERE link IN ({placeholders})", chunk)
+        existing.update(row[0] for row in cur)
+    return existing
+
+
+def upsert_jobs_bulk(conn: sqlite3.Connection, jobs: List[Dict[str, Any]]) -> int:
+    """
+    Speichert viele Stellenanzeigen in einer einzigen Transaktion.
+    
+    Bestehende Einträge werden nur bei besserem Score aktualisiert;
+    alles läuft über executemany mit nur einem Commit.
+    
+    Args:
+        conn: Offene Datenbankverbindung (siehe connect_db)
+        jobs: Liste von Job-Dictionaries
         
-        if existing:
-            # Update bei besserer Score
-            cur.execute("""
-                UPDATE jobs SET 
-                    score = ?,
-                    last_updated = ?
-                WHERE link = ? AND score < ?
-            """, (
-                job.get("score", 0.0),
-                datetime.utcnow().isoformat(),
-                job.get("link"),
-                job.get("score", 0.0)
-            ))
-            conn.commit()
-            return False
-        else:
-            # Neuen Eintrag erstellen
-            cur.execute("""
+    Returns:
+        Anzahl neu eingefügter Jobs
+    """
+    if not jobs:
+        return 0
+    
+    now = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    rows = [
+        (
+            job.get("title"),
+            job.get("company"),
+            job.get("location"),
+            job.get("link"),
+            job.get("published"),
+            job.get("summary"),
+            job.get("score", 0.0),
+            job.get("source"),
+            now,
+            now
+        )
+        for job in jobs
+    ]
+    
+    links = list({row[3] for row in rows})
+    
+    try:
+        with conn:
+            # Neuzugänge über den Link-Index bestimmen statt die ganze Tabelle zu zählen
+            new_jobs = len(links) - len(_existing_links(conn, links))
+            # Bestehende Einträge nur bei besserem Score aktualisieren
+            conn.executemany("""
                 INSERT INTO jobs
                 (title, company, location, link, published, summary, score, source, created_at)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                job.get("title"),
-                job.get("company"),
-                job.get("location"),
-                job.get("link"),
-                job.get("published"),
-                job.get("summary"),
-                job.get("score", 0.0),
-                job.get("source"),
-                datetime.utcnow().isoformat()
-            ))
-            conn.commit()
-            return True
-    except sqlite3.IntegrityError:
-        logger.debug(f"Job bereits vorhanden: {job.get('link')}")
-        return False
+                ON CONFLICT(link) DO UPDATE SET
+                    score = excluded.score,
+                    last_updated = ?
+                WHERE excluded.score > jobs.score
+            """, rows)
+        return new_jobs
+    except Exception as e:
+        # Die Transaktion wurde zurückgerollt - kein einziger Job dieses Laufs ist gespeichert
+        logger.error(f"Fehler beim Speichern von {len(rows)} Jobs: {e}")
+        raise
+
+
+# Gemeinsame Abfrage für Rangliste, Anschreiben und Export - nutzt idx_score_published
+_JOBS_BY_SCORE_SQL = "SELECT * FROM jobs WHERE score > 0 ORDER BY score DESC, published DESC"
+
+
+def recently_fetched_links(db_path: str, max_age_hours: float) -> set:
+    """
+    Liefert die Links, deren Seite innerhalb der letzten max_age_hours geladen wurde.
+    
+    Diese Anzeigen müssen beim nächsten Lauf nicht erneut geladen und bewertet werden.
+    
+    Args:
+        db_path: Pfad zur Datenbankdatei
+        max_age_hours: Maximales Alter in Stunden
+        
+    Returns:
+        Menge von Links
+    """
+    # Gleiches Format wie in record_fetched_pages - verglichen wird als Text
+    cutoff = (datetime.now(timezone.utc) - timedelta(hours=max_age_hours)).isoformat(timespec="seconds")
+    conn = sqlite3.connect(db_path)
+    try:
+        cur = conn.execute("SELECT link FROM fetched_pages WHERE fetched_at >= ?", (cutoff,))
+        return {row[0] for row in cur}
     except Exception as e:
-        logger.error(f"Fehler beim Speichern des Jobs: {e}")
-        return False
+        logger.error(f"Fehler beim Laden bereits geladener Links: {e}")
+        return set()
     finally:
         conn.close()
 
 
+def load_page_validators(
+    db_path: str,
+    links: List[str],
+    chunk_size: int = 500
+) -> Dict[str, Tuple[Optional[str], Optional[str], str]]:
+    """
+    Lädt ETag/Last-Modified und den gespeicherten Seitentext für bedingte Abrufe.
+    
+    Args:
+        db_path: Pfad zur Datenbankdatei
+        links: Links, die gleich geladen werden
+        chunk_size: Links pro Abfrage (SQLite begrenzt die Anzahl der Parameter)
+        
+    Returns:
+        Dictionary {link: (etag, last_modified, page_text)}
+    """
+    validators = {}
+    conn = sqlite3.connect(db_path)
+    try:
+        for start in range(0, len(links), chunk_size):
+            chunk = links[start:start + chunk_size]
+            placeholders = ",".join("?" * len(chunk))
+            cur = conn.execute(f"""
+                SELECT link, etag, last_modified, page_text FROM fetched_pages
+                WHERE link IN ({placeholders})
+                  AND (etag IS NOT NULL OR last_modified IS NOT NULL)
+            """, chunk)
+            for link, etag, last_modified, page_text in cur:
+                validators[link] = (etag, last_modified, page_text)
+        return validators
+    except Exception as e:
+        logger.error(f"Fehler beim Laden der Seiten-Validatoren: {e}")
+        return {}
+    finally:
+        conn.close()
+
+
+def record_fetched_pages(
+    conn: sqlite3.Connection,
+    pages: List[Tuple[str, Optional[str], Optional[str], str]],
+    max_age_days: int
+) -> None:
+    """
+    Merkt sich alle geladenen Seiten - unabhängig vom Score - und löscht veraltete Einträge.
+    
+    Der Seitentext wird nur gespeichert, wenn ETag oder Last-Modified vorliegt;
+    ohne Validatoren kann ihn kein bedingter Abruf wiederverwenden.
+    
+    Args:
+        conn: Offene Datenbankverbindung (siehe connect_db)
+        pages: Liste von (link, etag, last_modified, page_text)
+        max_age_days: Einträge, die älter sind, werden gelöscht
+    """
+    now = datetime.now(timezone.utc)
+    fetched_at = now.isoformat(timespec="seconds")
+    cutoff = (now - timedelta(days=max_age_days)).isoformat(timespec="seconds")
+    with conn:
+        conn.executemany("""
+            INSERT OR REPLACE INTO fetched_pages (link, etag, last_modified, page_text, fetched_at)
+            VALUES (?, ?, ?, ?, ?)
+        """, [
+            (link, etag, last_modified, page_text if etag or last_modified else None, fetched_at)
+            for link, etag, last_modified, page_text in pages
+        ])
+        conn.execute("DELETE FROM fetched_pages WHERE fetched_at < ?", (cutoff,))
+
+
 def fetch_all_jobs(db_path: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
     """
     Lädt alle Stellenanzeigen aus der Datenbank, sortiert nach Score.
@@ -214,11 +467,10 @@ def fetch_all_jobs(db_path: str, limit: Optional[int] = None) -> List[Dict[str,
     conn.row_factory = sqlite3.Row
     try:
         cur = conn.cursor()
-        query = "SELECT * FROM jobs WHERE score > 0 ORDER BY score DESC, published DESC"
         if limit:
-            query += f" LIMIT {limit}"
-        
-        cur.execute(query)
+            cur.execute(_JOBS_BY_SCORE_SQL + " LIMIT ?", (limit,))
+        else:
+            cur.execute(_JOBS_BY_SCORE_SQL)
         rows = cur.fetchall()
         return [dict(row) for row in rows]
     except Exception as e:
@@ -242,6 +494,8 @@ def fetch_rss_entries(feed_url: str) -> List[Dict[str, Any]]:
     Returns:
         Liste von Einträgen aus dem Feed
     """
+    import feedparser
+    
     try:
         parsed = feedparser.parse(feed_url)
         
@@ -285,7 +539,26 @@ def extract_published(entry: Any) -> str:
             except Exception:
                 pass
     
-    return datetime.utcnow().isoformat(timespec="seconds")
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def throttle_host(url: str, min_interval: float) -> None:
+    """
+    Wartet, bis zwischen zwei Anfragen an denselben Host min_interval Sekunden liegen.
+    
+    Andere Hosts werden dabei nicht ausgebremst.
+    
+    Args:
+        url: Ziel-URL
+        min_interval: Mindestabstand in Sekunden
+    """
+    host = urlparse(url).netloc
+    with _last_fetch_lock:
+        now = time.monotonic()
+        slot = max(now, _last_fetch.get(host, now - min_interval) + min_interval)
+        _last_fetch[host] = slot
+    if slot > now:
+        time.sleep(slot - now)
 
 
 def fetch_page_text(url: str, timeout: int, ua: str) -> str:
@@ -302,17 +575,18 @@ def fetch_page_text(url: str, timeout: int, ua: str) -> str:
     """
     try:
         headers = {"User-Agent": ua}
-        resp = requests.get(url, timeout=timeout, headers=headers, allow_redirects=True)
+        session = _get_session()
+        resp = None
+        if requests_cache is not None:
+            # Frische Cache-Treffer kommen ohne Netz aus und brauchen keine Pause
+            cached = session.get(url, headers=headers, allow_redirects=True, only_if_cached=True)
+            if cached.status_code != 504 and not cached.is_expired:
+                resp = cached
+        if resp is None:
+            throttle_host(url, CONFIG["sleep_between_requests"])
+            resp = session.get(url, timeout=timeout, headers=headers, allow_redirects=True)
         resp.raise_for_status()
-        
-        soup = BeautifulSoup(resp.text, "html.parser")
-        
-        # Entfernen von irrelevanten Elementen
-        for element in soup(["script", "style", "noscript", "header", "footer", "nav"]):
-            element.decompose()
-        
-        text = soup.get_text(separator=" ", strip=True)
-        return text
+        return html_to_text(resp.text)
     except requests.RequestException as e:
         logger.debug(f"Fehler beim Laden der Seite {url}: {e}")
         return ""
@@ -321,6 +595,76 @@ def fetch_page_text(url: str, timeout: int, ua: str) -> str:
         return ""
 
 
+async def fetch_page_text_async(
+    session: "aiohttp.ClientSession",
+    url: str,
+    cached: Optional[Tuple[Optional[str], Optional[str], str]] = None
+) -> Tuple[str, Optional[str], Optional[str]]:
+    """
+    Asynchrone Variante von fetch_page_text mit bedingtem GET.
+    
+    Sind ETag/Last-Modified aus einem früheren Lauf bekannt (siehe load_page_validators),
+    werden sie als If-None-Match/If-Modified-Since mitgeschickt; bei 304 kommt der
+    gespeicherte Text zurück, ohne die Seite erneut zu laden.
+    
+    Args:
+        session: Offene aiohttp-Session (Timeout und User-Agent sind dort gesetzt)
+        url: URL der Webseite
+        cached: Optional (etag, last_modified, page_text) aus der Datenbank
+        
+    Returns:
+        Tuple (Text ohne HTML-Tags, ETag, Last-Modified)
+    """
+    headers = {}
+    if cached is not None:
+        etag, last_modified, _ = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+    
+    try:
+        async with session.get(url, allow_redirects=True, headers=headers) as resp:
+            if resp.status == 304 and cached is not None:
+                return cached[2], cached[0], cached[1]
+            resp.raise_for_status()
+            html = await resp.text()
+            etag, last_modified = resp.headers.get("ETag"), resp.headers.get("Last-Modified")
+        return html_to_text(html), etag, last_modified
+    except Exception as e:
+        logger.debug(f"Fehler beim Laden der Seite {url}: {e}")
+        return "", None, None
+
+
+def html_to_text(html: str) -> str:
+    """
+    Extrahiert den sichtbaren Text aus HTML, gekürzt auf max_page_chars Zeichen.
+    
+    Args:
+        html: HTML-Quelltext
+        
+    Returns:
+        Text ohne HTML-Tags
+    """
+    max_chars = CONFIG["max_page_chars"]
+    
+    if HTMLParser is not None:
+        tree = HTMLParser(html)
+        # Entfernen von irrelevanten Elementen
+        for element in tree.css("script, style, noscript, header, footer, nav"):
+            element.decompose()
+        root = tree.body or tree.root
+        return root.text(separator=" ", strip=True)[:max_chars] if root is not None else ""
+    
+    soup = BeautifulSoup(html, "html.parser")
+    
+    # Entfernen von irrelevanten Elementen
+    for element in soup(["script", "style", "noscript", "header", "footer", "nav"]):
+        element.decompose()
+    
+    return soup.get_text(separator=" ", strip=True)[:max_chars]
+
+
 def search_jobs_online(query: str, max_results: int = 15) -> List[str]:
     """
     Sucht Jobs über Google und extrahiert relevante URLs.
@@ -340,7 +684,9 @@ def search_jobs_online(query: str, max_results: int = 15) -> List[str]:
         )
         
         headers = {"User-Agent": CONFIG["user_agent"]}
-        resp = requests.get(search_url, headers=headers, timeout=10)
+        # Abstand zwischen den Suchanfragen wie bei allen anderen Hosts einhalten
+        throttle_host(search_url, CONFIG["sleep_between_requests"])
+        resp = _get_session().get(search_url, headers=headers, timeout=10)
         resp.raise_for_status()
         
         soup = BeautifulSoup(resp.text, "html.parser")
@@ -363,67 +709,149 @@ def search_jobs_online(query: str, max_results: int = 15) -> List[str]:
 # TEXTANALYSE UND BEWERTUNG
 # =============================================================================
 
+# Verneinungswörter und wie weit am Textanfang danach gesucht wird
+NEGATION_WORDS = frozenset({"kein", "keine", "keinen", "nicht", "ohne", "nie", "niemals"})
+NEGATION_WINDOW = 500
+_NEG_RE = re.compile(r'\b(?:' + '|'.join(sorted(NEGATION_WORDS)) + r')\b', re.IGNORECASE)
+
+
 def contains_negation(text: str) -> bool:
     """
     Prüft, ob der Text Verneinungen enthält (z.B. "kein Praktikum", "nicht erforderlich").
     
+    Ein Wortmuster reicht dafür; spaCy wird nicht mehr gebraucht.
+    
     Args:
         text: Zu analysierender Text
         
     Returns:
         True wenn Verneinung gefunden wurde
     """
-    try:
-        doc = nlp(text[:1000])  # Nur ersten Teil analysieren für Performance
-        
-        negation_words = {"kein", "keine", "keinen", "nicht", "ohne", "nie", "niemals"}
-        
-        for token in doc:
-            if token.dep_ == "neg" or token.text.lower() in negation_words:
-                return True
+    return _NEG_RE.search(text) is not None
+
+
+@lru_cache(maxsize=8)
+def _alternation_pattern(words: Tuple[str, ...]) -> "re.Pattern":
+    """
+    Fasst eine Wortliste zu einem einzigen Alternations-Muster zusammen.
+    
+    Der Text wird damit nur einmal durchlaufen statt einmal pro Wort.
+    Längere Wörter stehen vorne, damit sie vor ihren Präfixen greifen.
+    Der Cache hängt an der Liste selbst, ändert sich die Konfiguration,
+    wird das Muster automatisch neu gebaut.
+    
+    Args:
+        words: Wörter in Kleinschreibung als Tupel (hashbar)
         
-        return False
-    except Exception as e:
-        logger.debug(f"Fehler bei Negationserkennung: {e}")
-        return False
+    Returns:
+        Kompiliertes Muster
+    """
+    ordered = sorted(set(words), key=len, reverse=True)
+    return re.compile(r'\b(?:' + '|'.join(re.escape(w) for w in ordered) + r')\b')
 
 
-def count_keyword_hits(text: str, keywords: List[str]) -> int:
+def count_keyword_hits(text_lower: str, keywords_lower: List[str]) -> int:
     """
     Zählt die Treffer von Schlüsselwörtern im Text.
     
     Args:
-        text: Zu durchsuchender Text
-        keywords: Liste von Schlüsselwörtern
+        text_lower: Zu durchsuchender Text in Kleinschreibung
+        keywords_lower: Liste von Schlüsselwörtern in Kleinschreibung
         
     Returns:
         Anzahl der Treffer
     """
-    text_lower = text.lower()
-    score = 0
-    
-    for keyword in keywords:
-        # Wort-Grenzen beachten für genauere Treffer
-        pattern = r'\b' + re.escape(keyword.lower()) + r'\b'
-        matches = len(re.findall(pattern, text_lower))
-        score += matches
-    
-    return score
+    if not keywords_lower:
+        return 0
+    # Wort-Grenzen beachten für genauere Treffer
+    return len(_alternation_pattern(tuple(keywords_lower)).findall(text_lower))
 
 
-def boost_for_city(text: str, preferred_cities: List[str]) -> int:
+def boost_for_city(text_lower: str, cities_lower: List[str]) -> int:
     """
     Gibt Bonus-Punkte für bevorzugte Städte.
     
     Args:
-        text: Text zur Analyse
-        preferred_cities: Liste bevorzugter Städte
+        text_lower: Text zur Analyse in Kleinschreibung
+        cities_lower: Liste bevorzugter Städte in Kleinschreibung
         
     Returns:
         Bonus-Punktzahl
     """
-    text_lower = text.lower()
-    return sum(2 for city in preferred_cities if city.lower() in text_lower)
+    if not cities_lower:
+        return 0
+    # Jede Stadt zählt nur einmal, egal wie oft sie vorkommt
+    if ahocorasick is not None:
+        found = {city for _, city in _city_automaton(tuple(cities_lower)).iter(text_lower)}
+        return 2 * len(found)
+    # Ohne Automat reicht ein einfacher Teilstring-Test - schneller als ein Regex
+    return sum(2 for city in cities_lower if city in text_lower)
+
+
+@lru_cache(maxsize=4)
+def _city_automaton(cities: Tuple[str, ...]):
+    """
+    Baut einen Aho-Corasick-Automaten für eine Städteliste.
+    
+    Der Text wird in einem Durchlauf gescannt, unabhängig davon, wie lang
+    die Liste ist. Der Wert jedes Eintrags ist die Stadt in Kleinschreibung.
+    
+    Args:
+        cities: Städte als Tupel (hashbar)
+        
+    Returns:
+        Fertiger ahocorasick.Automaton
+    """
+    automaton = ahocorasick.Automaton()
+    for city in cities:
+        automaton.add_word(city.lower(), city.lower())
+    automaton.make_automaton()
+    return automaton
+
+
+def _is_whole_word(text: str, start: int, end: int) -> bool:
+    """
+    Prüft, ob text[start:end + 1] ein ganzes Wort ist (wie \\b im Regex).
+    
+    Args:
+        text: Durchsuchter Text
+        start: Index des ersten Zeichens
+        end: Index des letzten Zeichens
+        
+    Returns:
+        True wenn an beiden Enden eine Wort-Grenze liegt
+    """
+    def is_word(char: str) -> bool:
+        return char.isalnum() or char == "_"
+    
+    # Wie \b: Grenze heißt Wechsel zwischen Wortzeichen und Nicht-Wortzeichen,
+    # bei Mustern wie "c++" also ein Wortzeichen nach dem letzten "+"
+    before = text[start - 1] if start > 0 else " "
+    after = text[end + 1] if end + 1 < len(text) else " "
+    return is_word(before) != is_word(text[start]) and is_word(after) != is_word(text[end])
+
+
+def scan_text(text_lower: str, keywords_lower: List[str], cities_lower: List[str]) -> Tuple[int, int, bool]:
+    """
+    Zählt Schlüsselwörter, Stadt-Bonus und Verneinungswörter.
+    
+    Ein Alternations-Muster, ein Aho-Corasick-Durchlauf und ein Wortmuster sind
+    in Python schneller als ein Hyperscan-Scan mit Rückruf pro Treffer.
+    Verneinungswörter zählen nur in den ersten NEGATION_WINDOW Zeichen.
+    
+    Args:
+        text_lower: Zu durchsuchender Text in Kleinschreibung
+        keywords_lower: Liste von Schlüsselwörtern in Kleinschreibung
+        cities_lower: Liste bevorzugter Städte in Kleinschreibung
+        
+    Returns:
+        Tuple (Schlüsselwort-Treffer, Stadt-Bonus, Verneinungswort gefunden)
+    """
+    return (
+        count_keyword_hits(text_lower, keywords_lower),
+        boost_for_city(text_lower, cities_lower),
+        contains_negation(text_lower[:NEGATION_WINDOW]),
+    )
 
 
 def extract_company_location(title: str, summary: str) -> Tuple[str, str]:
@@ -439,26 +867,58 @@ def extract_company_location(title: str, summary: str) -> Tuple[str, str]:
     """
     combined = f"{title} {summary}"
     
-    # Standort extrahieren
-    location_pattern = r'\b(Berlin|Dresden|München|Munich|Hamburg|Erlangen|Nürnberg|Frankfurt|Stuttgart|Leipzig|Köln|Düsseldorf|Hannover)\b'
-    loc_match = re.search(location_pattern, combined, re.IGNORECASE)
-    location = loc_match.group(0) if loc_match else ""
+    # Standort extrahieren - erster Treffer als ganzes Wort
+    location = ""
+    combined_lower = combined.lower()
+    if ahocorasick is not None and len(combined_lower) == len(combined):
+        first = None
+        for end, city in _city_automaton(LOCATION_CITIES).iter(combined_lower):
+            start = end - len(city) + 1
+            if (first is None or start < first[0]) and _is_whole_word(combined_lower, start, end):
+                first = (start, end)
+        if first is not None:
+            location = combined[first[0]:first[1] + 1]
+    else:
+        loc_match = _LOCATION_RE.search(combined)
+        location = loc_match.group(0) if loc_match else ""
     
     # Firmenname extrahieren
-    company_pattern = r'\b([A-ZÄÖÜ][A-Za-zÄÖÜäöüß0-9&.\- ]{2,40})\s+(GmbH|AG|SE|KG|GmbH & Co\.\s*KG|e\.V\.|Inc\.|Ltd\.)'
-    comp_match = re.search(company_pattern, combined)
+    comp_match = _COMPANY_RE.search(combined)
     company = comp_match.group(0).strip() if comp_match else ""
     
     return company, location
 
 
-def score_job_entry(entry: Dict[str, Any], cfg: Dict[str, Any]) -> Dict[str, Any]:
+def build_job_text(entry: Dict[str, Any], cfg: Dict[str, Any], page_text: Optional[str] = None) -> str:
+    """
+    Baut den Analysetext einer Anzeige aus Titel, Zusammenfassung und Seitentext.
+    
+    Args:
+        entry: Dictionary mit Stelleninformationen
+        cfg: Konfigurationsdictionary
+        page_text: Bereits geladener Seitentext (sonst wird die Seite geladen)
+        
+    Returns:
+        Kombinierter Text
+    """
+    if page_text is None:
+        # Seitentext laden für bessere Analyse
+        page_text = fetch_page_text(entry.get("link", ""), cfg["http_timeout"], cfg["user_agent"])
+    return f"{entry.get('title', '')} {entry.get('summary', '')} {page_text}"
+
+
+def score_job_entry(
+    entry: Dict[str, Any],
+    cfg: Dict[str, Any],
+    combined_text: Optional[str] = None
+) -> Dict[str, Any]:
     """
     Bewertet eine Stellenanzeige basierend auf Schlüsselwörtern und Relevanz.
     
     Args:
         entry: Dictionary mit Stelleninformationen
         cfg: Konfigurationsdictionary
+        combined_text: Vorbereiteter Text aus build_job_text (sonst wird er hier gebaut)
         
     Returns:
         Bewertetes Job-Dictionary mit Score
@@ -469,12 +929,17 @@ def score_job_entry(entry: Dict[str, Any], cfg: Dict[str, Any]) -> Dict[str, Any
     published = entry.get("published", "")
     source = entry.get("source", "")
     
-    # Seitentext laden für bessere Analyse
-    page_text = fetch_page_text(link, cfg["http_timeout"], cfg["user_agent"])
-    combined_text = f"{title} {summary} {page_text}"
+    if combined_text is None:
+        combined_text = build_job_text(entry, cfg)
+    
+    # Schlüsselwörter, Städte und Verneinungswörter zählen
+    # Nur einmal in Kleinschreibung umwandeln, alle Scanner arbeiten damit
+    base_score, city_boost, negated = scan_text(
+        combined_text.lower(), cfg["_keywords_lower"], cfg["_cities_lower"]
+    )
     
     # Verneinungen prüfen (z.B. "kein Praktikum")
-    if contains_negation(combined_text[:500]):
+    if negated:
         logger.debug(f"Job übersprungen (Verneinung erkannt): {title}")
         return {
             "title": title,
@@ -487,9 +952,6 @@ def score_job_entry(entry: Dict[str, Any], cfg: Dict[str, Any]) -> Dict[str, Any
             "source": source,
         }
     
-    # Score berechnen
-    base_score = count_keyword_hits(combined_text, cfg["keywords"])
-    city_boost = boost_for_city(combined_text, cfg["user"]["preferred_cities"])
     final_score = base_score + city_boost
     
     # Firma und Standort extrahieren
@@ -510,6 +972,182 @@ def score_job_entry(entry: Dict[str, Any], cfg: Dict[str, Any]) -> Dict[str, Any
     }
 
 
+# Eine geladene Seite für fetched_pages: (link, etag, last_modified, page_text)
+PageRecord = Tuple[str, Optional[str], Optional[str], str]
+
+
+def _page_record(link: str, page_text: str, etag: Optional[str] = None,
+                 last_modified: Optional[str] = None) -> Optional[PageRecord]:
+    """
+    Baut den fetched_pages-Eintrag für eine Seite (None, wenn nichts geladen wurde).
+    
+    Args:
+        link: URL der Seite
+        page_text: Geladener Text
+        etag: ETag-Header der Antwort
+        last_modified: Last-Modified-Header der Antwort
+        
+    Returns:
+        PageRecord oder None
+    """
+    return (link, etag, last_modified, page_text) if page_text else None
+
+
+def process_entry(entry: Dict[str, Any], cfg: Dict[str, Any]) -> Tuple[Dict[str, Any], Optional[PageRecord]]:
+    """
+    Lädt die Seite einer RSS-Anzeige und bewertet sie (läuft im Thread-Pool).
+    
+    Args:
+        entry: Dictionary mit Stelleninformationen
+        cfg: Konfigurationsdictionary
+        
+    Returns:
+        Tuple (bewertetes Job-Dictionary, geladene Seite oder None)
+    """
+    link = entry.get("link", "")
+    page_text = fetch_page_text(link, cfg["http_timeout"], cfg["user_agent"])
+    job_row = score_job_entry(entry, cfg, build_job_text(entry, cfg, page_text))
+    return job_row, _page_record(link, page_text)
+
+
+def process_search_link(
+    query: str,
+    link: str,
+    cfg: Dict[str, Any]
+) -> Tuple[Optional[Dict[str, Any]], Optional[PageRecord]]:
+    """
+    Lädt ein Suchergebnis und bewertet es (läuft im Thread-Pool).
+    
+    Args:
+        query: Suchanfrage, die den Link geliefert hat
+        link: URL des Suchergebnisses
+        cfg: Konfigurationsdictionary
+        
+    Returns:
+        Tuple (bewertetes Job-Dictionary oder None bei leerer Seite, geladene Seite oder None)
+    """
+    page_text = fetch_page_text(link, cfg["http_timeout"], cfg["user_agent"])
+    return score_search_page(query, link, page_text, cfg), _page_record(link, page_text)
+
+
+def score_search_page(query: str, link: str, page_text: str, cfg: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Baut aus einem geladenen Suchergebnis eine Anzeige und bewertet sie.
+    
+    Args:
+        query: Suchanfrage, die den Link geliefert hat
+        link: URL des Suchergebnisses
+        page_text: Geladener Seitentext
+        cfg: Konfigurationsdictionary
+        
+    Returns:
+        Bewertetes Job-Dictionary oder None, wenn die Seite leer war
+    """
+    if not page_text:
+        return None
+    
+    entry = {
+        "title": query,
+        "link": link,
+        "summary": page_text[:500],
+        "published": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "source": "Google Suche",
+    }
+    return score_job_entry(entry, cfg, build_job_text(entry, cfg, page_text))
+
+
+async def gather_all(
+    entries: List[Dict[str, Any]],
+    search_links: List[Tuple[str, str]],
+    cfg: Dict[str, Any],
+    validators: Dict[str, Tuple[Optional[str], Optional[str], str]]
+) -> List[Tuple[Optional[Dict[str, Any]], Optional[PageRecord]]]:
+    """
+    Lädt alle Seiten gleichzeitig über aiohttp und bewertet sie direkt nach dem Laden.
+    
+    Das Verbindungslimit pro Host ersetzt die feste Pause zwischen den Anfragen.
+    
+    Args:
+        entries: RSS-Anzeigen
+        search_links: Paare (Suchanfrage, URL) aus der Online-Suche
+        cfg: Konfigurationsdictionary
+        validators: ETag/Last-Modified und Text früherer Läufe (siehe load_page_validators)
+        
+    Returns:
+        Paare (bewertetes Job-Dictionary oder None, geladene Seite oder None)
+    """
+    connector = aiohttp.TCPConnector(
+        limit=cfg["max_connections"],
+        limit_per_host=cfg["max_connections_per_host"],
+    )
+    timeout = aiohttp.ClientTimeout(total=cfg["http_timeout"])
+    headers = {"User-Agent": cfg["user_agent"]}
+    
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=headers) as session:
+        # Ein Link aus mehreren Feeds oder Suchen wird nur einmal geladen;
+        # alle Anzeigen mit diesem Link warten auf denselben Abruf
+        fetches: Dict[str, "asyncio.Future"] = {}
+        
+        async def fetch(link):
+            first = link not in fetches
+            if first:
+                fetches[link] = asyncio.ensure_future(
+                    fetch_page_text_async(session, link, validators.get(link))
+                )
+            page_text, etag, last_modified = await fetches[link]
+            page = _page_record(link, page_text, etag, last_modified) if first else None
+            return page_text, page
+        
+        async def rss_task(entry):
+            page_text, page = await fetch(entry.get("link", ""))
+            return score_job_entry(entry, cfg, build_job_text(entry, cfg, page_text)), page
+        
+        async def search_task(query, link):
+            page_text, page = await fetch(link)
+            return score_search_page(query, link, page_text, cfg), page
+        
+        tasks = [rss_task(entry) for entry in entries]
+        tasks += [search_task(query, link) for query, link in search_links]
+        return await asyncio.gather(*tasks)
+
+
+def collect_job_rows(
+    entries: List[Dict[str, Any]],
+    search_links: List[Tuple[str, str]],
+    cfg: Dict[str, Any],
+    validators: Optional[Dict[str, Tuple[Optional[str], Optional[str], str]]] = None
+) -> Tuple[List[Dict[str, Any]], List[PageRecord]]:
+    """
+    Lädt und bewertet alle Anzeigen - mit aiohttp, sonst über den Thread-Pool.
+    
+    Mit aiohttp werden die validators für bedingte Abrufe genutzt; der Thread-Pool
+    verlässt sich dafür auf requests-cache (falls installiert).
+    
+    Args:
+        entries: RSS-Anzeigen
+        search_links: Paare (Suchanfrage, URL) aus der Online-Suche
+        cfg: Konfigurationsdictionary
+        validators: ETag/Last-Modified und Text früherer Läufe (siehe load_page_validators)
+        
+    Returns:
+        Tuple (bewertete Job-Dictionaries, alle erfolgreich geladenen Seiten)
+    """
+    if aiohttp is not None:
+        results = asyncio.run(gather_all(entries, search_links, cfg, validators or {}))
+    else:
+        with ThreadPoolExecutor(max_workers=cfg["max_workers"]) as executor:
+            futures = [executor.submit(process_entry, entry, cfg) for entry in entries]
+            futures += [
+                executor.submit(process_search_link, query, link, cfg)
+                for query, link in search_links
+            ]
+            results = [future.result() for future in as_completed(futures)]
+    
+    job_rows = [job_row for job_row, _ in results if job_row is not None]
+    pages = [page for _, page in results if page is not None]
+    return job_rows, pages
+
+
 # =============================================================================
 # EXPORT UND ANSCHREIBEN-GENERIERUNG
 # =============================================================================
@@ -522,20 +1160,53 @@ def export_to_csv(db_path: str, csv_path: str) -> None:
         db_path: Pfad zur Datenbankdatei
         csv_path: Pfad zur Export-CSV-Datei
     """
+    conn = sqlite3.connect(db_path)
     try:
-        rows = fetch_all_jobs(db_path)
+        # Sortierung übernimmt SQLite; die Zeilen werden direkt vom Cursor geschrieben
+        cur = conn.execute(_JOBS_BY_SCORE_SQL)
+        first = cur.fetchone()
         
-        if not rows:
+        if first is None:
             logger.warning("Keine Jobs zum Exportieren vorhanden.")
             return
         
-        df = pd.DataFrame(rows)
-        df = df.sort_values('score', ascending=False)
-        df.to_csv(csv_path, index=False, encoding='utf-8-sig', quoting=csv.QUOTE_ALL)
+        count = 1
+        with open(csv_path, "w", encoding="utf-8-sig", newline="") as f:
+            writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+            writer.writerow([col[0] for col in cur.description])
+            writer.writerow(first)
+            for row in cur:
+                writer.writerow(row)
+                count += 1
         
-        logger.info(f"✅ {len(rows)} Jobs erfolgreich nach {csv_path} exportiert")
+        logger.info(f"✅ {count} Jobs erfolgreich nach {csv_path} exportiert")
     except Exception as e:
         logger.error(f"Fehler beim CSV-Export: {e}")
+    finally:
+        conn.close()
+
+
+# Vorlage für Anschreiben - wird nur einmal angelegt und pro Job per format_map befüllt
+_LETTER_TEMPLATE = """Sehr geehrte Damen und Herren,
+
+mit großem Interesse bin ich auf Ihre Stellenausschreibung "{job_title}" {location_text} aufmerksam geworden.
+
+{profile_summary}
+
+Meine Qualifikationen und meine Motivation passen hervorragend zu den Anforderungen der Position. Besonders reizt mich die Möglichkeit, meine technischen Kenntnisse in einem innovativen Umfeld einzubringen und weiterzuentwickeln.
+
+Gerne überzeuge ich Sie in einem persönlichen Gespräch von meinen Fähigkeiten und meiner Begeisterung für diese Position.
+
+Mit freundlichen Grüßen
+
+{name}
+E-Mail: {email}
+Telefon: {phone}
+
+---
+Stellenlink: {link}
+Bewertung: {score} Punkte
+"""
 
 
 def generate_cover_letter(job: Dict[str, Any], user: Dict[str, Any]) -> str:
@@ -549,32 +1220,46 @@ def generate_cover_letter(job: Dict[str, Any], user: Dict[str, Any]) -> str:
     Returns:
         Anschreiben als String
     """
-    company = job.get("company") or "Ihr Unternehmen"
-    job_title = job.get("title") or "die ausgeschriebene Position"
     city = job.get("location") or ""
-    location_text = f"in {city}" if city else ""
     
-    letter = f"""Sehr geehrte Damen und Herren,
-
-mit großem Interesse bin ich auf Ihre Stellenausschreibung "{job_title}" {location_text} aufmerksam geworden.
+    return _LETTER_TEMPLATE.format_map({
+        "job_title": job.get("title") or "die ausgeschriebene Position",
+        "location_text": f"in {city}" if city else "",
+        "profile_summary": user.get("profile_summary", ""),
+        "name": user.get("name", ""),
+        "email": user.get("email", ""),
+        "phone": user.get("phone", ""),
+        "link": job.get("link", ""),
+        "score": job.get("score", 0),
+    })
 
-{user.get('profile_summary', '')}
 
-Meine Qualifikationen und meine Motivation passen hervorragend zu den Anforderungen der Position. Besonders reizt mich die Möglichkeit, meine technischen Kenntnisse in einem innovativen Umfeld einzubringen und weiterzuentwickeln.
-
-Gerne überzeuge ich Sie in einem persönlichen Gespräch von meinen Fähigkeiten und meiner Begeisterung für diese Position.
-
-Mit freundlichen Grüßen
-
-{user.get('name', '')}
-E-Mail: {user.get('email', '')}
-Telefon: {user.get('phone', '')}
-
----
-Stellenlink: {job.get('link', '')}
-Bewertung: {job.get('score', 0)} Punkte
-"""
-    return letter
+def _write_letter(idx: int, job: Dict[str, Any], user: Dict[str, Any], output_dir: str) -> Optional[str]:
+    """
+    Erstellt ein Anschreiben und speichert es als Textdatei (läuft im Thread-Pool).
+    
+    Args:
+        idx: Platz des Jobs in der Rangliste (für den Dateinamen)
+        job: Job-Dictionary
+        user: User-Konfiguration
+        output_dir: Zielordner
+        
+    Returns:
+        Das Anschreiben oder None, wenn die Datei nicht geschrieben werden konnte
+    """
+    letter = generate_cover_letter(job, user)
+    
+    # Dateiname sicher erstellen
+    safe_title = _SAFE_TITLE_RE.sub('', job.get('title', f'job_{idx}'))[:50]
+    fname = os.path.join(output_dir, f"anschreiben_{idx:02d}_{safe_title}.txt")
+    
+    try:
+        Path(fname).write_text(letter, encoding="utf-8")
+        logger.info(f"✉️  Anschreiben erstellt: {fname}")
+        return letter
+    except Exception as e:
+        logger.error(f"Fehler beim Erstellen des Anschreibens {fname}: {e}")
+        return None
 
 
 def generate_top_letters(db_path: str, user: Dict[str, Any], top_n: int = 5) -> List[str]:
@@ -590,25 +1275,17 @@ def generate_top_letters(db_path: str, user: Dict[str, Any], top_n: int = 5) ->
         Liste der generierten Anschreiben
     """
     rows = fetch_all_jobs(db_path, limit=top_n)
-    letters = []
     
     output_dir = "bewerbungen"
     os.makedirs(output_dir, exist_ok=True)
     
-    for idx, job in enumerate(rows, 1):
-        letter = generate_cover_letter(job, user)
-        
-        # Dateiname sicher erstellen
-        safe_title = re.sub(r'[^\w\s-]', '', job.get('title', f'job_{idx}'))[:50]
-        fname = os.path.join(output_dir, f"anschreiben_{idx:02d}_{safe_title}.txt")
-        
-        try:
-            with open(fname, "w", encoding="utf-8") as f:
-                f.write(letter)
-            logger.info(f"✉️  Anschreiben erstellt: {fname}")
-            letters.append(letter)
-        except Exception as e:
-            logger.error(f"Fehler beim Erstellen des Anschreibens {fname}: {e}")
+    # Dateien unabhängig voneinander parallel schreiben; map behält die Reihenfolge bei
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = executor.map(
+            lambda item: _write_letter(item[0], item[1], user, output_dir),
+            enumerate(rows, 1)
+        )
+        letters = [letter for letter in results if letter is not None]
     
     if not letters:
         logger.warning("Keine passenden Jobs für Anschreiben gefunden.")
@@ -629,56 +1306,53 @@ def main():
     # Datenbank initialisieren
     init_db(CONFIG["db_path"])
     
-    total_processed = 0
-    new_jobs = 0
-    
     # -------------------------
     # 1. RSS-Feeds durchsuchen
     # -------------------------
     logger.info("\n📥 Phase 1: RSS-Feeds werden durchsucht...")
     
+    entries: List[Dict[str, Any]] = []
     for feed in CONFIG["feeds"]:
         logger.info(f"Lese Feed: {feed}")
-        entries = fetch_rss_entries(feed)
-        logger.info(f"  ↳ {len(entries)} Einträge gefunden")
-        
-        for entry in entries:
-            job_row = score_job_entry(entry, CONFIG)
-            if job_row["score"] > 0:
-                if upsert_job(CONFIG["db_path"], job_row):
-                    new_jobs += 1
-            total_processed += 1
-            time.sleep(CONFIG["sleep_between_requests"])
+        feed_entries = fetch_rss_entries(feed)
+        logger.info(f"  ↳ {len(feed_entries)} Einträge gefunden")
+        entries.extend(feed_entries)
     
     # -------------------------
     # 2. Online-Suche
     # -------------------------
     logger.info("\n🌍 Phase 2: Erweiterte Online-Suche...")
     
+    search_links: List[Tuple[str, str]] = []
     for query in CONFIG["search_queries"]:
         logger.info(f"Suche: {query}")
         links = search_jobs_online(query, max_results=10)
         logger.info(f"  ↳ {len(links)} URLs gefunden")
-        
-        for link in links:
-            page_text = fetch_page_text(link, CONFIG["http_timeout"], CONFIG["user_agent"])
-            if not page_text:
-                continue
-            
-            entry = {
-                "title": query,
-                "link": link,
-                "summary": page_text[:500],
-                "published": datetime.utcnow().isoformat(),
-                "source": "Google Suche",
-            }
-            
-            job_row = score_job_entry(entry, CONFIG)
-            if job_row["score"] > 0:
-                if upsert_job(CONFIG["db_path"], job_row):
-                    new_jobs += 1
-            total_processed += 1
-            time.sleep(CONFIG["sleep_between_requests"])
+        search_links.extend((query, link) for link in links)
+    
+    # Kürzlich geladene Links überspringen - sie wurden schon bewertet (auch die mit Score 0)
+    recent = recently_fetched_links(CONFIG["db_path"], CONFIG["refetch_after_hours"])
+    if recent:
+        before = len(entries) + len(search_links)
+        entries = [entry for entry in entries if entry["link"] not in recent]
+        search_links = [(query, link) for query, link in search_links if link not in recent]
+        skipped = before - len(entries) - len(search_links)
+        logger.info(f"  ↳ {skipped} kürzlich geladene Links werden übersprungen")
+    
+    # Seiten parallel laden und bewerten; gespeichert wird danach in einer Transaktion
+    validators = {}
+    if aiohttp is not None:
+        links = [entry["link"] for entry in entries] + [link for _, link in search_links]
+        validators = load_page_validators(CONFIG["db_path"], links)
+    job_rows, pages = collect_job_rows(entries, search_links, CONFIG, validators)
+    total_processed = len(job_rows)
+    
+    conn = connect_db(CONFIG["db_path"])
+    try:
+        new_jobs = upsert_jobs_bulk(conn, [job_row for job_row in job_rows if job_row["score"] > 0])
+        record_fetched_pages(conn, pages, CONFIG["page_cache_max_age_days"])
+    finally:
+        conn.close()
     
     # -------------------------
     # 3. Ergebnisse anzeigen